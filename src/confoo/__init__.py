@@ -0,0 +1,18 @@
+import importlib
+
+_LAZY_SCREENS = {
+    "ScheduleScreen": "confoo.screens.schedule",
+    "MyCalendarScreen": "confoo.screens.my_calendar",
+    "SessionDetailScreen": "confoo.screens.session_detail",
+    "SyncScreen": "confoo.screens.sync",
+}
+
+
+def __getattr__(name: str):
+    """Import screen classes on first access and cache them on the package."""
+    module_name = _LAZY_SCREENS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
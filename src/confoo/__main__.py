@@ -6,19 +6,22 @@ def run_sync():
     """Run the scraper from the command line."""
     from confoo.db import ConfooDB
     from confoo.scraper import ConFooScraper
+    from confoo.scrape_cache import ScrapeCache
     from confoo.export import export_json_snapshot
     from confoo.data_loader import DATA_DIR
 
     print("ConFoo 2026 Sync")
     print("=" * 40)
 
-    with ConfooDB() as db:
-        scraper = ConFooScraper(db, log=print)
+    with ConfooDB() as db, ScrapeCache() as cache:
+        scraper = ConFooScraper(db, log=print, cache=cache)
         asyncio.run(scraper.run_full_sync())
 
         json_path = DATA_DIR / "confoo2026.json"
-        export_json_snapshot(db, json_path)
-        print(f"JSON snapshot exported to {json_path}")
+        if export_json_snapshot(db, json_path):
+            print(f"JSON snapshot exported to {json_path}")
+        else:
+            print(f"JSON snapshot unchanged at {json_path}")
 
 
 def run_app():
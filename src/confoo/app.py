@@ -3,6 +3,7 @@ from pathlib import Path
 from textual.app import App
 from textual.binding import Binding
 
+from confoo import MyCalendarScreen, ScheduleScreen, SyncScreen
 from confoo.data_loader import DataLoader, load_speaker_ratings
 from confoo.calendar_manager import CalendarManager
 from confoo.models import SpeakerRating
@@ -32,7 +33,6 @@ class ConFooApp(App):
         self.speaker_ratings: dict[str, SpeakerRating] = load_speaker_ratings()
 
     def on_mount(self) -> None:
-        from confoo.screens.schedule import ScheduleScreen
         self.install_screen(ScheduleScreen(), "schedule")
 
         count = self.data_loader.session_count()
@@ -50,13 +50,15 @@ class ConFooApp(App):
         self.switch_screen("schedule")
 
     def action_show_calendar(self) -> None:
-        from confoo.screens.my_calendar import MyCalendarScreen
         self.push_screen(MyCalendarScreen())
 
     def action_show_sync(self) -> None:
-        from confoo.screens.sync import SyncScreen
         self.push_screen(SyncScreen())
 
     def action_quit(self) -> None:
-        self.data_loader.close()
         self.exit()
+
+    def on_unmount(self) -> None:
+        # Runs on every exit path (q, ctrl+c, errors), so toggles are never lost.
+        self.calendar_manager.flush()
+        self.data_loader.close()
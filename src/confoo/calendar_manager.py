@@ -1,7 +1,9 @@
-import json
+import heapq
 import logging
 from pathlib import Path
 from confoo.models import Session
+from confoo.day_utils import time_to_minutes
+from confoo.json_utils import JSONDecodeError, dump_json, load_json
 
 logger = logging.getLogger(__name__)
 
@@ -15,36 +17,46 @@ class CalendarManager:
         self.path = calendar_path or CALENDAR_PATH
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self._selected_slugs: set[str] = set()
+        self._selected_view: frozenset[str] | None = None
+        self._dirty = False
         self._load()
 
     def _load(self):
         """Load selections from disk."""
         if self.path.exists():
             try:
-                with open(self.path) as f:
-                    data = json.load(f)
+                data = load_json(self.path)
                 self._selected_slugs = set(data.get("selected", []))
-            except (json.JSONDecodeError, KeyError, OSError) as exc:
+            except (JSONDecodeError, KeyError, OSError) as exc:
                 logger.warning("Could not load calendar file %s: %s", self.path, exc)
                 self._selected_slugs = set()
 
-    def _save(self):
-        """Persist selections to disk via atomic temp-file swap."""
+    def flush(self):
+        """Persist pending changes to disk via atomic temp-file swap.
+
+        Selections are only written when they changed since the last flush.
+        """
+        if not self._dirty:
+            return
         data = {"selected": sorted(self._selected_slugs)}
         tmp_path = self.path.with_suffix(".tmp")
-        with open(tmp_path, "w") as f:
-            json.dump(data, f, indent=2)
+        tmp_path.write_bytes(dump_json(data))
         tmp_path.replace(self.path)
+        self._dirty = False
 
     def add(self, slug: str):
-        """Add a session to the personal calendar."""
-        self._selected_slugs.add(slug)
-        self._save()
+        """Add a session to the personal calendar. Call flush() to persist."""
+        if slug not in self._selected_slugs:
+            self._selected_slugs.add(slug)
+            self._selected_view = None
+            self._dirty = True
 
     def remove(self, slug: str):
-        """Remove a session from the personal calendar."""
-        self._selected_slugs.discard(slug)
-        self._save()
+        """Remove a session from the personal calendar. Call flush() to persist."""
+        if slug in self._selected_slugs:
+            self._selected_slugs.discard(slug)
+            self._selected_view = None
+            self._dirty = True
 
     def toggle(self, slug: str) -> bool:
         """Toggle a session. Returns True if now selected."""
@@ -58,8 +70,11 @@ class CalendarManager:
         return slug in self._selected_slugs
 
     @property
-    def selected_slugs(self) -> set[str]:
-        return set(self._selected_slugs)
+    def selected_slugs(self) -> frozenset[str]:
+        """Read-only view of the selection, rebuilt only after it changes."""
+        if self._selected_view is None:
+            self._selected_view = frozenset(self._selected_slugs)
+        return self._selected_view
 
     def get_selected_sessions(self, all_sessions: list[Session]) -> list[Session]:
         """Get full Session objects for all selections."""
@@ -68,35 +83,33 @@ class CalendarManager:
     def find_conflicts(self, sessions: list[Session]) -> dict[str, list[str]]:
         """Find time conflicts among selected sessions.
 
+        Sessions are bucketed by day and swept in start-time order, keeping a
+        min-heap of the end times of sessions still in progress.
+
         Returns a dict mapping session slug to list of conflicting session slugs.
         """
-        selected = self.get_selected_sessions(sessions)
-        conflicts: dict[str, list[str]] = {}
+        by_day: dict[str, list[tuple[int, int, str]]] = {}
+        for s in self.get_selected_sessions(sessions):
+            if not s.day or not s.start_time:
+                continue
+            try:
+                start = time_to_minutes(s.start_time)
+                end = time_to_minutes(s.end_time) if s.end_time else start + 60
+            except (ValueError, IndexError):
+                continue
+            by_day.setdefault(s.day, []).append((start, end, s.slug))
 
-        for i, a in enumerate(selected):
-            for b in selected[i + 1:]:
-                if a.day != b.day or not a.day:
-                    continue
-                if not a.start_time or not b.start_time:
-                    continue
-                if self._times_overlap(a.start_time, a.end_time, b.start_time, b.end_time):
-                    conflicts.setdefault(a.slug, []).append(b.slug)
-                    conflicts.setdefault(b.slug, []).append(a.slug)
+        conflicts: dict[str, list[str]] = {}
+        for intervals in by_day.values():
+            intervals.sort()
+            active: list[tuple[int, int, str]] = []
+            for start, end, slug in intervals:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for _, other_start, other in active:
+                    if other_start < end:
+                        conflicts.setdefault(other, []).append(slug)
+                        conflicts.setdefault(slug, []).append(other)
+                heapq.heappush(active, (end, start, slug))
 
         return conflicts
-
-    @staticmethod
-    def _times_overlap(start_a: str, end_a: str, start_b: str, end_b: str) -> bool:
-        """Check if two time ranges overlap."""
-        def to_minutes(t: str) -> int:
-            parts = t.split(":")
-            return int(parts[0]) * 60 + int(parts[1])
-
-        try:
-            sa = to_minutes(start_a)
-            ea = to_minutes(end_a) if end_a else sa + 60
-            sb = to_minutes(start_b)
-            eb = to_minutes(end_b) if end_b else sb + 60
-            return sa < eb and sb < ea
-        except (ValueError, IndexError):
-            return False
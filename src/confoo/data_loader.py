@@ -1,13 +1,15 @@
-import json
 import logging
+import sys
 from pathlib import Path
 
 from confoo.models import Speaker, Session, SpeakerRating
 from confoo.db import ConfooDB, DEFAULT_DB_PATH
+from confoo.json_utils import JSONDecodeError, load_json
 
 logger = logging.getLogger(__name__)
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+SNAPSHOT_PATH = DATA_DIR / "confoo2026.json"
 
 
 def load_speaker_ratings() -> dict[str, SpeakerRating]:
@@ -16,61 +18,61 @@ def load_speaker_ratings() -> dict[str, SpeakerRating]:
     if not ratings_path.exists():
         return {}
     try:
-        with open(ratings_path) as f:
-            data = json.load(f)
+        data = load_json(ratings_path)
         return {
             slug: SpeakerRating(slug=slug, tier=info["tier"], note=info.get("note", ""))
             for slug, info in data.items()
         }
-    except (json.JSONDecodeError, KeyError):
+    except (JSONDecodeError, KeyError):
         logger.warning("Corrupt speaker ratings file %s, returning empty ratings", ratings_path)
         return {}
 
 
-def load_sessions_from_json() -> list[Session]:
-    """Load sessions from the static JSON snapshot."""
-    json_path = DATA_DIR / "confoo2026.json"
-    if not json_path.exists():
-        return []
-    with open(json_path) as f:
-        data = json.load(f)
+def _read_snapshot() -> dict:
+    """Parse the static JSON snapshot, or return an empty dict if it is missing."""
+    if not SNAPSHOT_PATH.exists():
+        return {}
+    return load_json(SNAPSHOT_PATH)
+
+
+def _sessions_from_records(records: list[dict]) -> list[Session]:
+    """Build Session objects from snapshot session records, interning repeated values."""
     sessions = []
-    for s in data.get("sessions", []):
+    for s in records:
         raw_tracks = s.get("tracks", [])
-        clean_tracks = []
-        for t in raw_tracks:
-            if "\t" in t:
-                clean_tracks.extend(part.strip() for part in t.split("\t") if part.strip())
-            else:
-                clean_tracks.append(t)
-        clean_tracks = list(dict.fromkeys(clean_tracks))
+        if any("\t" in t for t in raw_tracks):
+            clean_tracks = []
+            seen = set()
+            for t in raw_tracks:
+                for part in t.split("\t"):
+                    part = part.strip()
+                    if part and part not in seen:
+                        seen.add(part)
+                        clean_tracks.append(sys.intern(part))
+        else:
+            clean_tracks = [sys.intern(t) for t in raw_tracks]
         sessions.append(Session(
             slug=s["slug"],
             title=s["title"],
             abstract=s.get("abstract", ""),
-            day=s.get("day", ""),
+            day=sys.intern(s.get("day", "")),
             start_time=s.get("start_time", ""),
             end_time=s.get("end_time", ""),
-            room=s.get("room", ""),
-            language=s.get("language", ""),
-            level=s.get("level", ""),
+            room=sys.intern(s.get("room", "")),
+            language=sys.intern(s.get("language", "")),
+            level=sys.intern(s.get("level", "")),
             is_keynote=s.get("is_keynote", False),
-            speaker_slug=s.get("speaker_slug", ""),
+            speaker_slug=sys.intern(s.get("speaker_slug", "")),
             speaker_name=s.get("speaker_name", ""),
             tracks=clean_tracks,
         ))
     return sessions
 
 
-def load_speakers_from_json() -> list[Speaker]:
-    """Load speakers from the static JSON snapshot."""
-    json_path = DATA_DIR / "confoo2026.json"
-    if not json_path.exists():
-        return []
-    with open(json_path) as f:
-        data = json.load(f)
+def _speakers_from_records(records: list[dict]) -> list[Speaker]:
+    """Build Speaker objects from snapshot speaker records."""
     speakers = []
-    for s in data.get("speakers", []):
+    for s in records:
         speakers.append(Speaker(
             slug=s["slug"],
             name=s["name"],
@@ -84,31 +86,75 @@ def load_speakers_from_json() -> list[Speaker]:
     return speakers
 
 
+def load_snapshot(data: dict | None = None) -> tuple[list[Session], list[Speaker]]:
+    """Load sessions and speakers from a single parse of the JSON snapshot.
+
+    An already-parsed snapshot can be passed as data to skip reading the file.
+    Each section's raw records are released as soon as they are converted, so
+    the parsed JSON and the model objects are never both fully alive.
+    """
+    if data is None:
+        data = _read_snapshot()
+    else:
+        data = dict(data)
+    sessions = _sessions_from_records(data.pop("sessions", []))
+    speakers = _speakers_from_records(data.pop("speakers", []))
+    return sessions, speakers
+
+
+def load_sessions_from_json() -> list[Session]:
+    """Load sessions from the static JSON snapshot."""
+    return _sessions_from_records(_read_snapshot().get("sessions", []))
+
+
+def load_speakers_from_json() -> list[Speaker]:
+    """Load speakers from the static JSON snapshot."""
+    return _speakers_from_records(_read_snapshot().get("speakers", []))
+
+
 class DataLoader:
     """SQLite-first data loader with JSON fallback."""
 
-    def __init__(self):
+    def __init__(self, snapshot: dict | None = None):
         self._db: ConfooDB | None = None
         self._using_json = False
         self._json_sessions: list[Session] | None = None
         self._json_speakers: list[Speaker] | None = None
-        self._init_source()
-
-    def _init_source(self):
-        """Try SQLite first, fall back to JSON."""
+        self._sessions_by_day: dict[str, list[Session]] = {}
+        self._sessions_by_slug: dict[str, Session] = {}
+        self._speakers_by_slug: dict[str, Speaker] = {}
+        self._days: list[str] = []
+        self._tracks: list[str] = []
+        self._init_source(snapshot)
+
+    def _init_source(self, snapshot: dict | None = None):
+        """Try SQLite first, fall back to JSON (or a snapshot the caller already parsed)."""
+        db = None
         try:
             if DEFAULT_DB_PATH.exists():
                 db = ConfooDB()
                 if db.session_count() > 0:
                     self._db = db
                     return
-                db.close()
         except Exception:
             pass
+        if db is not None:
+            db.close()
 
         self._using_json = True
-        self._json_sessions = load_sessions_from_json()
-        self._json_speakers = load_speakers_from_json()
+        self._json_sessions, self._json_speakers = load_snapshot(snapshot)
+        self._build_json_indexes()
+
+    def _build_json_indexes(self):
+        """Index the JSON snapshot once so lookups don't rescan every session."""
+        tracks: set[str] = set()
+        for s in self._json_sessions:
+            self._sessions_by_day.setdefault(s.day, []).append(s)
+            self._sessions_by_slug[s.slug] = s
+            tracks.update(s.tracks)
+        self._speakers_by_slug = {s.slug: s for s in self._json_speakers}
+        self._days = sorted(day for day in self._sessions_by_day if day)
+        self._tracks = sorted(tracks)
 
     @property
     def source_name(self) -> str:
@@ -124,23 +170,17 @@ class DataLoader:
     def get_sessions_by_day(self, day: str) -> list[Session]:
         if self._db:
             return self._db.get_sessions_by_day(day)
-        return [s for s in (self._json_sessions or []) if s.day == day]
+        return list(self._sessions_by_day.get(day, []))
 
     def get_session(self, slug: str) -> Session | None:
         if self._db:
             return self._db.get_session(slug)
-        for s in (self._json_sessions or []):
-            if s.slug == slug:
-                return s
-        return None
+        return self._sessions_by_slug.get(slug)
 
     def get_speaker(self, slug: str) -> Speaker | None:
         if self._db:
             return self._db.get_speaker(slug)
-        for s in (self._json_speakers or []):
-            if s.slug == slug:
-                return s
-        return None
+        return self._speakers_by_slug.get(slug)
 
     def get_all_speakers(self) -> list[Speaker]:
         if self._db:
@@ -150,16 +190,12 @@ class DataLoader:
     def get_all_days(self) -> list[str]:
         if self._db:
             return self._db.get_all_days()
-        days = sorted({s.day for s in (self._json_sessions or []) if s.day})
-        return days
+        return list(self._days)
 
     def get_all_tracks(self) -> list[str]:
         if self._db:
             return self._db.get_all_tracks()
-        tracks = set()
-        for s in (self._json_sessions or []):
-            tracks.update(s.tracks)
-        return sorted(tracks)
+        return list(self._tracks)
 
     def get_last_sync(self) -> str | None:
         if self._db:
@@ -1,9 +1,15 @@
 import logging
 import re
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_ISO_RE = re.compile(r"2026-02-(\d{2})")
+_FEB_RE = re.compile(r"February\s+(\d+)")
+_SIMPLE_RE = re.compile(r"^(\d{1,2})$")
+_HHMM_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
 DAY_LABELS = {
     "23": "Mon 23",
     "24": "Tue 24",
@@ -12,7 +18,9 @@ DAY_LABELS = {
     "27": "Fri 27",
 }
 
-CONFERENCE_DAYS = {"25", "26", "27"}
+CONFERENCE_DAYS = frozenset({25, 26, 27})
+
+UNKNOWN_DAY_INDEX = 99
 
 DAY_NAME_TO_NUM = {
     "monday": "23",
@@ -23,6 +31,7 @@ DAY_NAME_TO_NUM = {
 }
 
 
+@lru_cache(maxsize=64)
 def day_number(day: str) -> str:
     """Extract the February day number from a day string.
 
@@ -32,11 +41,11 @@ def day_number(day: str) -> str:
     - "2026-02-25"
     - "25"
     """
-    iso_match = re.search(r"2026-02-(\d{2})", day)
+    iso_match = _ISO_RE.search(day)
     if iso_match:
         return str(int(iso_match.group(1)))
 
-    feb_match = re.search(r"February\s+(\d+)", day)
+    feb_match = _FEB_RE.search(day)
     if feb_match:
         return feb_match.group(1)
 
@@ -44,7 +53,7 @@ def day_number(day: str) -> str:
         if name in day.lower():
             return num
 
-    simple_match = re.match(r"^(\d{1,2})$", day.strip())
+    simple_match = _SIMPLE_RE.match(day.strip())
     if simple_match:
         return simple_match.group(1)
 
@@ -52,17 +61,26 @@ def day_number(day: str) -> str:
     return day
 
 
-def day_sort_key(day: str) -> str:
+@lru_cache(maxsize=64)
+def day_index(day: str) -> int:
+    """February day number as an int; unrecognized days sort after all known ones."""
+    num = day_number(day)
+    return int(num) if num.isdigit() else UNKNOWN_DAY_INDEX
+
+
+def day_sort_key(day: str) -> int:
     """Sort key for day strings."""
-    return day_number(day).zfill(2)
+    return day_index(day)
 
 
+@lru_cache(maxsize=64)
 def make_tab_label(day: str) -> str:
     """Create a short tab label from a day string."""
     num = day_number(day)
     return DAY_LABELS.get(num, day[:15])
 
 
+@lru_cache(maxsize=64)
 def day_display(day: str) -> str:
     """Format a day string for display."""
     num = day_number(day)
@@ -72,6 +90,7 @@ def day_display(day: str) -> str:
     return day
 
 
+@lru_cache(maxsize=512)
 def time_sort_key(time_str: str) -> str:
     """Zero-pad a time string for proper lexicographic sorting."""
     parts = time_str.split(":")
@@ -80,6 +99,13 @@ def time_sort_key(time_str: str) -> str:
     return time_str
 
 
+@lru_cache(maxsize=512)
+def time_to_minutes(time_str: str) -> int:
+    """Convert an 'HH:MM' string to minutes since midnight."""
+    parts = time_str.split(":")
+    return int(parts[0]) * 60 + int(parts[1])
+
+
 def format_time_range(start: str, end: str, separator: str = "-") -> str:
     """Format a start/end time pair into a display string."""
     if end:
@@ -87,12 +113,13 @@ def format_time_range(start: str, end: str, separator: str = "-") -> str:
     return start
 
 
+@lru_cache(maxsize=64)
 def parse_day_date(day_str: str) -> datetime | None:
     """Parse a day string into a datetime date."""
-    iso_match = re.search(r"2026-02-(\d{2})", day_str)
+    iso_match = _ISO_RE.search(day_str)
     if iso_match:
         return datetime(2026, 2, int(iso_match.group(1)))
-    feb_match = re.search(r"February\s+(\d+)", day_str)
+    feb_match = _FEB_RE.search(day_str)
     if feb_match:
         return datetime(2026, 2, int(feb_match.group(1)))
     for name, num in DAY_NAME_TO_NUM.items():
@@ -105,7 +132,7 @@ def parse_time(time_str: str, base_date: datetime) -> datetime | None:
     """Parse a time like '10:00' into a datetime."""
     if not time_str:
         return None
-    match = re.match(r"(\d{1,2}):(\d{2})", time_str)
+    match = _HHMM_RE.match(time_str)
     if match:
         return base_date.replace(hour=int(match.group(1)), minute=int(match.group(2)), second=0)
     return None
@@ -1,11 +1,27 @@
 import sqlite3
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
+import sys
 
 from confoo.models import Speaker, Session, SpecialEvent
+from confoo.day_utils import UNKNOWN_DAY_INDEX, day_number, time_to_minutes
 
 DEFAULT_DB_PATH = Path.home() / ".local" / "share" / "confoo2026" / "confoo.db"
 
+TRACK_SEPARATOR = "\x1f"
+
+# Tracks are concatenated in insertion (site) order; plain GROUP_CONCAT over the
+# join would follow the (session_slug, track) key and come back alphabetical.
+SESSIONS_WITH_TRACKS = """
+SELECT s.slug, s.title, s.abstract, s.day, s.start_time, s.end_time, s.room,
+       s.language, s.level, s.is_keynote, s.speaker_slug, s.speaker_name,
+       (SELECT GROUP_CONCAT(track, char(31))
+          FROM (SELECT track FROM session_tracks
+                WHERE session_slug = s.slug ORDER BY rowid)) AS tracks
+FROM sessions s
+"""
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS speakers (
     slug TEXT PRIMARY KEY,
@@ -31,6 +47,9 @@ CREATE TABLE IF NOT EXISTS sessions (
     is_keynote INTEGER DEFAULT 0,
     speaker_slug TEXT DEFAULT '',
     speaker_name TEXT DEFAULT '',
+    day_num INTEGER,
+    start_min INTEGER,
+    end_min INTEGER,
     FOREIGN KEY (speaker_slug) REFERENCES speakers(slug)
 );
 
@@ -55,6 +74,38 @@ CREATE TABLE IF NOT EXISTS sync_meta (
 );
 """
 
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_sessions_day ON sessions(day);
+CREATE INDEX IF NOT EXISTS idx_sessions_day_num ON sessions(day_num, start_min);
+CREATE INDEX IF NOT EXISTS idx_session_tracks_track ON session_tracks(track);
+"""
+
+SORT_COLUMNS = ("day_num", "start_min", "end_min")
+
+
+def _day_num(day: str) -> int | None:
+    """Integer February day number for a day string, or None if unrecognized."""
+    num = day_number(day)
+    return int(num) if num.isdigit() else None
+
+
+def _minutes(time_str: str) -> int | None:
+    """Minutes since midnight for an 'HH:MM' string, or None if it can't be parsed."""
+    try:
+        return time_to_minutes(time_str)
+    except (ValueError, IndexError):
+        return None
+
+
+def _sort_values(day: str, start_time: str, end_time: str) -> tuple[int | None, int | None, int | None]:
+    """Integer (day_num, start_min, end_min) values stored alongside the text columns."""
+    return _day_num(day), _minutes(start_time), _minutes(end_time)
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a non-empty text column value; NULLs and empty strings pass through."""
+    return sys.intern(value) if value else value
+
 
 class ConfooDB:
     """SQLite database for ConFoo 2026 schedule data."""
@@ -65,12 +116,34 @@ class ConfooDB:
         self.conn = sqlite3.connect(str(self.db_path))
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self._init_schema()
 
     def _init_schema(self):
         self.conn.executescript(SCHEMA)
+        self._add_sort_columns()
+        self.conn.executescript(INDEXES)
         self.conn.commit()
 
+    def _add_sort_columns(self):
+        """Add and backfill the integer day/time columns on databases created before them."""
+        existing = {row["name"] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        missing = [col for col in SORT_COLUMNS if col not in existing]
+        if not missing:
+            return
+        for col in missing:
+            self.conn.execute(f"ALTER TABLE sessions ADD COLUMN {col} INTEGER")
+        rows = self.conn.execute(
+            "SELECT slug, day, start_time, end_time FROM sessions"
+        ).fetchall()
+        self.conn.executemany(
+            "UPDATE sessions SET day_num = ?, start_min = ?, end_min = ? WHERE slug = ?",
+            [
+                (*_sort_values(row["day"], row["start_time"], row["end_time"]), row["slug"])
+                for row in rows
+            ],
+        )
+
     def __enter__(self):
         return self
 
@@ -82,49 +155,68 @@ class ConfooDB:
 
     def upsert_speaker(self, speaker: Speaker):
         """Insert or update a speaker."""
-        self.conn.execute(
+        self.upsert_speakers([speaker])
+
+    def upsert_speakers(self, speakers: list[Speaker]):
+        """Insert or update many speakers in a single executemany call."""
+        self.conn.executemany(
             """INSERT INTO speakers (slug, name, company, country, bio, photo_url, website, twitter)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(slug) DO UPDATE SET
                  name=excluded.name, company=excluded.company, country=excluded.country,
                  bio=excluded.bio, photo_url=excluded.photo_url,
                  website=excluded.website, twitter=excluded.twitter""",
-            (speaker.slug, speaker.name, speaker.company, speaker.country,
-             speaker.bio, speaker.photo_url, speaker.website, speaker.twitter),
+            [
+                (sp.slug, sp.name, sp.company, sp.country,
+                 sp.bio, sp.photo_url, sp.website, sp.twitter)
+                for sp in speakers
+            ],
         )
 
     def upsert_session(self, session: Session):
         """Insert or update a session and its tracks."""
-        self.conn.execute(
+        self.upsert_sessions([session])
+
+    def upsert_sessions(self, sessions: list[Session]):
+        """Insert or update many sessions and their tracks in batched executemany calls."""
+        self.conn.executemany(
             """INSERT INTO sessions (slug, title, abstract, day, start_time, end_time,
-                 room, language, level, is_keynote, speaker_slug, speaker_name)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 room, language, level, is_keynote, speaker_slug, speaker_name,
+                 day_num, start_min, end_min)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                ON CONFLICT(slug) DO UPDATE SET
                  title=excluded.title, abstract=excluded.abstract, day=excluded.day,
                  start_time=excluded.start_time, end_time=excluded.end_time,
                  room=excluded.room, language=excluded.language, level=excluded.level,
                  is_keynote=excluded.is_keynote, speaker_slug=excluded.speaker_slug,
-                 speaker_name=excluded.speaker_name""",
-            (session.slug, session.title, session.abstract, session.day,
-             session.start_time, session.end_time, session.room, session.language,
-             session.level, int(session.is_keynote), session.speaker_slug,
-             session.speaker_name),
+                 speaker_name=excluded.speaker_name, day_num=excluded.day_num,
+                 start_min=excluded.start_min, end_min=excluded.end_min""",
+            [
+                (s.slug, s.title, s.abstract, s.day, s.start_time, s.end_time,
+                 s.room, s.language, s.level, int(s.is_keynote), s.speaker_slug,
+                 s.speaker_name, *_sort_values(s.day, s.start_time, s.end_time))
+                for s in sessions
+            ],
         )
-        self.conn.execute(
-            "DELETE FROM session_tracks WHERE session_slug = ?", (session.slug,)
+        self.conn.executemany(
+            "DELETE FROM session_tracks WHERE session_slug = ?",
+            [(s.slug,) for s in sessions],
+        )
+        self.conn.executemany(
+            "INSERT INTO session_tracks (session_slug, track) VALUES (?, ?)",
+            [(s.slug, track) for s in sessions for track in s.tracks],
         )
-        for track in session.tracks:
-            self.conn.execute(
-                "INSERT INTO session_tracks (session_slug, track) VALUES (?, ?)",
-                (session.slug, track),
-            )
 
     def upsert_special_event(self, event: SpecialEvent):
         """Insert a special event."""
-        self.conn.execute(
+        self.upsert_special_events([event])
+
+    def upsert_special_events(self, events: list[SpecialEvent]):
+        """Insert many special events in a single executemany call."""
+        self.conn.executemany(
             """INSERT INTO special_events (day, start_time, end_time, name)
                VALUES (?, ?, ?, ?)""",
-            (event.day, event.start_time, event.end_time, event.name),
+            [(e.day, e.start_time, e.end_time, e.name) for e in events],
         )
 
     def set_sync_meta(self, key: str, value: str):
@@ -144,36 +236,40 @@ class ConfooDB:
     def commit(self):
         self.conn.commit()
 
+    @contextmanager
+    def transaction(self):
+        """Group writes into one transaction, committed on success and rolled back on error."""
+        with self.conn:
+            yield self
+
     def clear_all(self):
-        """Clear all data for a fresh sync."""
+        """Clear all data for a fresh sync. The caller is responsible for committing."""
         self.conn.execute("DELETE FROM session_tracks")
         self.conn.execute("DELETE FROM sessions")
         self.conn.execute("DELETE FROM speakers")
         self.conn.execute("DELETE FROM special_events")
-        self.conn.commit()
 
-    def _row_to_session(self, row, tracks: list[str] | None = None) -> Session:
-        """Build a Session from a database row."""
-        if tracks is None:
-            tracks_rows = self.conn.execute(
-                "SELECT track FROM session_tracks WHERE session_slug = ?",
-                (row["slug"],),
-            ).fetchall()
-            tracks = [t["track"] for t in tracks_rows]
+    def _row_to_session(self, row: tuple) -> Session:
+        """Build a Session from a plain tuple row of SESSIONS_WITH_TRACKS.
+
+        Low-cardinality fields are interned so sessions share one string per value.
+        """
+        (slug, title, abstract, day, start_time, end_time, room, language,
+         level, is_keynote, speaker_slug, speaker_name, tracks) = row
         return Session(
-            slug=row["slug"],
-            title=row["title"],
-            abstract=row["abstract"],
-            day=row["day"],
-            start_time=row["start_time"],
-            end_time=row["end_time"],
-            room=row["room"],
-            language=row["language"],
-            level=row["level"],
-            is_keynote=bool(row["is_keynote"]),
-            speaker_slug=row["speaker_slug"],
-            speaker_name=row["speaker_name"],
-            tracks=tracks,
+            slug=slug,
+            title=title,
+            abstract=abstract,
+            day=_intern(day),
+            start_time=start_time,
+            end_time=end_time,
+            room=_intern(room),
+            language=_intern(language),
+            level=_intern(level),
+            is_keynote=bool(is_keynote),
+            speaker_slug=_intern(speaker_slug),
+            speaker_name=speaker_name,
+            tracks=[sys.intern(t) for t in tracks.split(TRACK_SEPARATOR)] if tracks else [],
         )
 
     def _row_to_speaker(self, row) -> Speaker:
@@ -189,57 +285,34 @@ class ConfooDB:
             twitter=row["twitter"],
         )
 
-    def _fetch_tracks(self, slugs: list[str] | None = None) -> dict[str, list[str]]:
-        """Pre-fetch session tracks in a single query, optionally scoped to specific slugs."""
-        if slugs is not None:
-            if not slugs:
-                return {}
-            placeholders = ",".join("?" * len(slugs))
-            rows = self.conn.execute(
-                f"SELECT session_slug, track FROM session_tracks WHERE session_slug IN ({placeholders})",
-                slugs,
-            ).fetchall()
-        else:
-            rows = self.conn.execute(
-                "SELECT session_slug, track FROM session_tracks"
-            ).fetchall()
-        tracks_map: dict[str, list[str]] = {}
-        for row in rows:
-            tracks_map.setdefault(row["session_slug"], []).append(row["track"])
-        return tracks_map
+    def _query_sessions(self, clause: str, params: tuple = ()) -> list[Session]:
+        """Run SESSIONS_WITH_TRACKS with a trailing clause, reading rows as plain tuples."""
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        rows = cur.execute(SESSIONS_WITH_TRACKS + clause, params).fetchall()
+        return [self._row_to_session(row) for row in rows]
 
     def get_all_sessions(self) -> list[Session]:
-        """Get all sessions with their tracks."""
-        rows = self.conn.execute(
-            "SELECT * FROM sessions ORDER BY day, start_time, room"
-        ).fetchall()
-        tracks_map = self._fetch_tracks()
-        return [
-            self._row_to_session(row, tracks_map.get(row["slug"], []))
-            for row in rows
-        ]
+        """Get all sessions with their tracks; unrecognized days sort last, as in the JSON path."""
+        return self._query_sessions(
+            f"ORDER BY COALESCE(s.day_num, {UNKNOWN_DAY_INDEX}), s.day, s.start_min, s.room"
+        )
 
     def get_sessions_by_day(self, day: str) -> list[Session]:
         """Get sessions for a specific day."""
-        rows = self.conn.execute(
-            "SELECT * FROM sessions WHERE day = ? ORDER BY start_time, room",
-            (day,),
-        ).fetchall()
-        slugs = [row["slug"] for row in rows]
-        tracks_map = self._fetch_tracks(slugs)
-        return [
-            self._row_to_session(row, tracks_map.get(row["slug"], []))
-            for row in rows
-        ]
+        num = _day_num(day)
+        if num is None:
+            return self._query_sessions(
+                "WHERE s.day = ? ORDER BY s.start_min, s.room", (day,)
+            )
+        return self._query_sessions(
+            "WHERE s.day_num = ? ORDER BY s.start_min, s.room", (num,)
+        )
 
     def get_session(self, slug: str) -> Session | None:
         """Get a single session by slug."""
-        row = self.conn.execute(
-            "SELECT * FROM sessions WHERE slug = ?", (slug,)
-        ).fetchone()
-        if not row:
-            return None
-        return self._row_to_session(row)
+        sessions = self._query_sessions("WHERE s.slug = ?", (slug,))
+        return sessions[0] if sessions else None
 
     def get_speaker(self, slug: str) -> Speaker | None:
         """Get a single speaker by slug."""
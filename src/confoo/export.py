@@ -1,65 +1,50 @@
-import json
-from pathlib import Path
+from dataclasses import fields
 from datetime import datetime, timedelta
+from hashlib import blake2b
+from operator import attrgetter
+from pathlib import Path
 
 from confoo.models import Session, Speaker
 from confoo.db import ConfooDB
 from confoo.day_utils import parse_day_date, parse_time
+from confoo.json_utils import dump_json
+
+_SESSION_FIELDS = tuple(f.name for f in fields(Session))
+_SPEAKER_FIELDS = tuple(f.name for f in fields(Speaker))
+_EVENT_FIELDS = ("day", "start_time", "end_time", "name")
+
+_session_values = attrgetter(*_SESSION_FIELDS)
+_speaker_values = attrgetter(*_SPEAKER_FIELDS)
+_event_values = attrgetter(*_EVENT_FIELDS)
+
 
+def export_json_snapshot(db: ConfooDB, output_path: Path) -> bool:
+    """Export the full database to a JSON snapshot file.
 
-def export_json_snapshot(db: ConfooDB, output_path: Path):
-    """Export the full database to a JSON snapshot file."""
+    The write is skipped when the content hash matches the one recorded for the
+    last export and the file is still there. Returns True if the file was written.
+    """
     sessions = db.get_all_sessions()
     speakers = db.get_all_speakers()
     events = db.get_special_events()
 
-    data = {
-        "exported_at": datetime.now().isoformat(),
-        "sessions": [
-            {
-                "slug": s.slug,
-                "title": s.title,
-                "abstract": s.abstract,
-                "day": s.day,
-                "start_time": s.start_time,
-                "end_time": s.end_time,
-                "room": s.room,
-                "language": s.language,
-                "level": s.level,
-                "is_keynote": s.is_keynote,
-                "speaker_slug": s.speaker_slug,
-                "speaker_name": s.speaker_name,
-                "tracks": s.tracks,
-            }
-            for s in sessions
-        ],
-        "speakers": [
-            {
-                "slug": sp.slug,
-                "name": sp.name,
-                "company": sp.company,
-                "country": sp.country,
-                "bio": sp.bio,
-                "photo_url": sp.photo_url,
-                "website": sp.website,
-                "twitter": sp.twitter,
-            }
-            for sp in speakers
-        ],
-        "special_events": [
-            {
-                "day": e.day,
-                "start_time": e.start_time,
-                "end_time": e.end_time,
-                "name": e.name,
-            }
-            for e in events
-        ],
+    payload = {
+        "sessions": [dict(zip(_SESSION_FIELDS, _session_values(s))) for s in sessions],
+        "speakers": [dict(zip(_SPEAKER_FIELDS, _speaker_values(sp))) for sp in speakers],
+        "special_events": [dict(zip(_EVENT_FIELDS, _event_values(e))) for e in events],
     }
+    encoded = dump_json(payload)
+    digest = blake2b(encoded, digest_size=16).hexdigest()
+    if output_path.exists() and db.get_sync_meta("snapshot_hash") == digest:
+        return False
 
+    # Splice exported_at in as the first key rather than encoding the snapshot again.
+    stamp = dump_json(datetime.now().isoformat())
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    output_path.write_bytes(b'{\n  "exported_at": ' + stamp + b"," + encoded[1:])
+    db.set_sync_meta("snapshot_hash", digest)
+    db.commit()
+    return True
 
 
 def export_ical(sessions: list[Session], output_path: Path):
@@ -0,0 +1,30 @@
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def parse_json(data: bytes):
+    """Parse JSON bytes, using orjson when installed (the `fast` extra)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path):
+    """Read and parse a JSON file."""
+    return parse_json(path.read_bytes())
+
+
+def dump_json(data, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, two-space indented unless indent is False."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
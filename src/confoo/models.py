@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Speaker:
     """A conference speaker."""
 
@@ -15,7 +15,7 @@ class Speaker:
     twitter: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """A conference session."""
 
@@ -38,7 +38,7 @@ TIER_STARS = {"S": "★★★★★", "A": "★★★★", "B": "★★★", "C"
 TIER_BADGES = {"S": "Exceptional", "A": "Excellent", "B": "Good", "C": "Average"}
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeakerRating:
     """Curated speaker quality rating."""
 
@@ -58,7 +58,7 @@ class SpeakerRating:
         return TIER_BADGES.get(self.tier, "")
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecialEvent:
     """Non-session schedule event (lunch, networking, etc.)."""
 
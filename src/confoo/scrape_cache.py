@@ -0,0 +1,60 @@
+import sqlite3
+import time
+from pathlib import Path
+
+from confoo.json_utils import dump_json, parse_json
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "confoo2026" / "scrape.db"
+CACHE_MAX_AGE = 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class ScrapeCache:
+    """Persistent cache of extracted page data keyed by URL.
+
+    Each entry is committed as soon as it is stored, so an interrupted sync
+    resumes from the pages it already fetched.
+    """
+
+    def __init__(self, cache_path: Path | None = None, max_age: float = CACHE_MAX_AGE):
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.conn = sqlite3.connect(str(self.cache_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, url: str) -> dict | None:
+        """Return the cached data for url, or None if missing or older than max_age."""
+        row = self.conn.execute(
+            "SELECT data FROM pages WHERE url = ? AND fetched_at >= ?",
+            (url, time.time() - self.max_age),
+        ).fetchone()
+        return parse_json(row[0]) if row else None
+
+    def put(self, url: str, data: dict):
+        """Store extracted data for url."""
+        self.conn.execute(
+            """INSERT INTO pages (url, data, fetched_at) VALUES (?, ?, ?)
+               ON CONFLICT(url) DO UPDATE SET data=excluded.data, fetched_at=excluded.fetched_at""",
+            (url, dump_json(data, indent=False), time.time()),
+        )
+        self.conn.commit()
@@ -1,15 +1,27 @@
 import asyncio
-from typing import Callable
+import sys
+from dataclasses import asdict
+from typing import Awaitable, Callable
 
 from confoo.models import Speaker, Session, SpecialEvent
 from confoo.db import ConfooDB
+from confoo.scrape_cache import ScrapeCache
 
 BASE_URL = "https://confoo.ca"
 SCHEDULE_URL = f"{BASE_URL}/en/2026/schedule"
 POLITENESS_DELAY = 0.5
+MAX_CONCURRENT_PAGES = 4
+NAVIGATION_TIMEOUT_MS = 15000
+WRITE_BATCH_SIZE = 100
+
+_EMPTY_DETAIL = {"abstract": "", "language": "", "level": ""}
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
 
 GRID_EXTRACTION_JS = """
 () => {
+  const RE_TIME = /\\d+:\\d+/g;
+  const RE_SESSION_SLUG = /\\/en\\/2026\\/session\\/(.+?)$/;
+  const RE_SPEAKER_SLUG = /\\/en\\/speaker\\/(.+?)$/;
   const days = document.querySelectorAll('.schedule-day');
   const allSessions = [];
   const allEvents = [];
@@ -28,7 +40,7 @@ GRID_EXTRACTION_JS = """
       if (!timeEl) return;
 
       const timeText = timeEl.textContent.trim();
-      const times = timeText.match(/\\d+:\\d+/g) || [];
+      const times = timeText.match(RE_TIME) || [];
       const startTime = times[0] || '';
       const endTime = times[1] || '';
 
@@ -47,13 +59,13 @@ GRID_EXTRACTION_JS = """
         if (!sessionEl) return;
 
         const href = sessionEl.getAttribute('href') || '';
-        const slugMatch = href.match(/\\/en\\/2026\\/session\\/(.+?)$/);
+        const slugMatch = href.match(RE_SESSION_SLUG);
         const slug = slugMatch ? slugMatch[1] : '';
         const title = sessionEl.textContent.trim();
 
         const speakerEl = slot.querySelector('.speaker a');
         const speakerHref = speakerEl ? speakerEl.getAttribute('href') || '' : '';
-        const speakerSlugMatch = speakerHref.match(/\\/en\\/speaker\\/(.+?)$/);
+        const speakerSlugMatch = speakerHref.match(RE_SPEAKER_SLUG);
         const speakerSlug = speakerSlugMatch ? speakerSlugMatch[1] : '';
         const speakerName = speakerEl ? speakerEl.textContent.trim() : '';
 
@@ -82,32 +94,246 @@ GRID_EXTRACTION_JS = """
 }
 """
 
+SESSION_DETAIL_JS = """
+() => {
+  const RE_LANG_KIND = /(English|French)\\s+(?:session|training)/i;
+  const RE_LEVEL = /(Beginner|Intermediate|Advanced)/i;
+  let abstract = '';
+  let language = '';
+  let level = '';
+
+  // One walk over the document collects everything the extractor needs:
+  // the language/level paragraph, abstract candidates, and the speaker section.
+  const ABSTRACT_SELECTORS = [
+    '.content > div > div > div > div',
+    '.col-md-12 > div > div > div > div'
+  ];
+  const content = document.querySelector('.content');
+  const abstracts = ['', ''];
+  const contentDivs = [];
+  let langFound = false;
+  let speakerSection = null;
+
+  const isAbstractCandidate = (div) => {
+    if (div.querySelector('h2') || div.querySelector('a[href*="share"]')) return false;
+    const text = div.textContent.trim();
+    return text.length > 50 &&
+        !text.includes('View all') &&
+        !text.includes('Share on') &&
+        !text.includes('Other training');
+  };
+
+  const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_ELEMENT);
+  for (let el = walker.nextNode(); el; el = walker.nextNode()) {
+    const tag = el.tagName;
+    if (tag === 'P' && !langFound) {
+      const text = el.textContent.trim();
+      const langMatch = text.match(RE_LANG_KIND);
+      if (langMatch) {
+        language = langMatch[1];
+        const levelMatch = text.match(RE_LEVEL);
+        if (levelMatch) level = levelMatch[1];
+        langFound = true;
+      }
+    } else if (tag === 'DIV') {
+      for (let i = 0; i < ABSTRACT_SELECTORS.length; i++) {
+        if (!abstracts[i] && el.matches(ABSTRACT_SELECTORS[i]) && isAbstractCandidate(el)) {
+          abstracts[i] = el.textContent.trim();
+        }
+      }
+      if (content && el !== content && content.contains(el)) contentDivs.push(el);
+    } else if (tag === 'H2' && !speakerSection) {
+      const parent = el.parentElement;
+      if (parent && parent.querySelector('a[href*="/speaker/"]')) speakerSection = parent;
+    }
+    if (langFound && abstracts[0] && speakerSection) break;
+  }
+  abstract = abstracts[0] || abstracts[1];
+
+  // Fallback: search for any substantial text div
+  if (!abstract) {
+    for (const div of contentDivs) {
+      if (div.children.length > 3) continue;
+      const text = div.textContent.trim();
+      if (text.length > 80 &&
+          !text.includes('View all') &&
+          !text.includes('Share on') &&
+          !text.includes('Home /') &&
+          !text.includes('Sponsored by') &&
+          !text.includes('Other training') &&
+          !div.querySelector('h2')) {
+        abstract = text;
+        break;
+      }
+    }
+  }
+
+  // Speaker info from the speaker section on session page
+  let speakerCompany = '';
+  let speakerBio = '';
+  let speakerCountry = '';
+  let speakerPhoto = '';
+  let speakerTwitter = '';
+  if (speakerSection) {
+    for (const p of speakerSection.querySelectorAll('p')) {
+      const text = p.textContent.trim();
+      if (text.includes('Read More') || text.length < 3) continue;
+      // Country: a span inside a paragraph (flag + country name). The paragraph
+      // still goes through the company/bio checks below as it always has.
+      const span = p.querySelector('span');
+      if (!speakerCountry && span) {
+        const spanText = span.textContent.trim();
+        if (spanText.length > 2 && spanText.length < 50 &&
+            !spanText.includes('session') && !spanText.includes('training')) {
+          speakerCountry = spanText;
+        }
+      }
+      if (!speakerCompany && text.length < 120) {
+        speakerCompany = text;
+      } else if (!speakerBio && text.length > 50) {
+        speakerBio = text;
+      }
+    }
+    const img = speakerSection.querySelector('img');
+    if (img) speakerPhoto = img.src || '';
+    for (const a of speakerSection.querySelectorAll('a[href]')) {
+      const href = a.getAttribute('href') || '';
+      if ((href.includes('twitter.com') || href.includes('x.com/')) &&
+          !href.includes('intent/tweet') && !href.includes('confooca')) {
+        speakerTwitter = href;
+        break;
+      }
+    }
+  }
+
+  return {
+    abstract, language, level,
+    speaker_company: speakerCompany, speaker_bio: speakerBio,
+    speaker_country: speakerCountry, speaker_photo_url: speakerPhoto,
+    speaker_twitter: speakerTwitter,
+  };
+}
+"""
+
+SPEAKER_JS = """
+() => {
+  const RE_SESSION_LINE = /session\\s*-|training\\s*-/i;
+  const h1 = document.querySelector('h1');
+  const name = h1 ? h1.textContent.trim() : '';
+
+  // Country: look for a span inside a paragraph (flag + country name)
+  let country = '';
+  const content = document.querySelector('.content') || document.querySelector('main');
+  const paras = content ? content.querySelectorAll('p') : [];
+  if (content) {
+    for (const p of paras) {
+      const span = p.querySelector('span');
+      if (span) {
+        const text = span.textContent.trim();
+        if (text.length > 2 && text.length < 50 &&
+            !text.includes('session') && !text.includes('training')) {
+          country = text;
+          break;
+        }
+      }
+    }
+  }
+
+  // Bio: find the first substantial paragraph text
+  let bio = '';
+  if (content) {
+    for (const p of paras) {
+      const text = p.textContent.trim();
+      if (text.length > 50 &&
+          !RE_SESSION_LINE.test(text) &&
+          !text.includes('Share on') &&
+          !text.includes('Read More') &&
+          !text.includes(country)) {
+        bio = text;
+        break;
+      }
+    }
+  }
+
+  // Photo: image with speaker name as alt
+  let photo_url = '';
+  if (name) {
+    const img = document.querySelector('img[alt="' + name.replace(/"/g, '\\\\"') + '"]');
+    if (img) photo_url = img.src || '';
+  }
+
+  // Social links
+  let twitter = '';
+  const links = document.querySelectorAll('a[href]');
+  for (const a of links) {
+    const href = a.getAttribute('href') || '';
+    if ((href.includes('twitter.com') || href.includes('x.com/')) &&
+        !href.includes('intent/tweet') && !href.includes('confooca')) {
+      twitter = href;
+      break;
+    }
+  }
+
+  return { name, country, bio, photo_url, twitter };
+}
+"""
+
+
+class RateLimiter:
+    """Spaces request starts at least min_interval seconds apart across concurrent tasks."""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        """Wait for the next free request slot and claim it."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = loop.time() + self.min_interval
+
 
 class ConFooScraper:
     """Three-phase scraper for the ConFoo 2026 schedule."""
 
-    def __init__(self, db: ConfooDB, log: Callable[[str], None] | None = None):
+    def __init__(
+        self,
+        db: ConfooDB,
+        log: Callable[[str], None] | None = None,
+        concurrency: int = MAX_CONCURRENT_PAGES,
+        cache: ScrapeCache | None = None,
+    ):
         self.db = db
         self.log = log or print
-        self._speaker_companies: dict[str, str] = {}
-        self._speaker_bios: dict[str, str] = {}
+        self.cache = cache
+        self.concurrency = concurrency
+        self._rate_limiter = RateLimiter(POLITENESS_DELAY)
+        self._session_speakers: dict[str, Speaker] = {}
 
     def _session_from_grid(self, slug: str, grid: dict, detail: dict | None = None) -> Session:
-        """Build a Session from grid data, optionally enriched with detail-page data."""
+        """Build a Session from grid data, optionally enriched with detail-page data.
+
+        Repeated values (day, room, language, level, speaker, tracks) are interned.
+        """
+        d = detail or _EMPTY_DETAIL
         return Session(
             slug=slug,
             title=grid["title"],
-            abstract=detail["abstract"] if detail else "",
-            day=grid["day"],
+            abstract=d["abstract"],
+            day=sys.intern(grid["day"]),
             start_time=grid["start_time"],
             end_time=grid["end_time"],
-            room=grid["room"],
-            language=detail["language"] if detail else "",
-            level=detail["level"] if detail else "",
+            room=sys.intern(grid["room"]),
+            language=sys.intern(d["language"]),
+            level=sys.intern(d["level"]),
             is_keynote=grid["is_keynote"],
-            speaker_slug=grid["speaker_slug"],
+            speaker_slug=sys.intern(grid["speaker_slug"]),
             speaker_name=grid["speaker_name"],
-            tracks=grid["tracks"],
+            tracks=[sys.intern(t) for t in grid["tracks"]],
         )
 
     async def run_full_sync(self):
@@ -119,29 +345,79 @@ class ConFooScraper:
             context = await browser.new_context(
                 user_agent="ConFoo2026-TUI-Planner/0.1 (personal schedule tool)"
             )
+            await context.route("**/*", self._block_heavy_resources)
             page = await context.new_page()
 
             try:
-                grid_sessions, speaker_slugs = await self._phase1_schedule_grid(page)
+                with self.db.transaction():
+                    grid_sessions, speaker_slugs = await self._phase1_schedule_grid(page)
 
-                if not grid_sessions:
-                    self.log("WARNING: No sessions found. Site layout may have changed. Aborting to preserve existing data.")
-                    return
+                    if not grid_sessions:
+                        self.log("WARNING: No sessions found. Site layout may have changed. Aborting to preserve existing data.")
+                        return
 
-                self.db.clear_all()
-                await self._phase2_session_details(page, grid_sessions)
-                await self._phase3_speaker_profiles(page, speaker_slugs)
+                    self.db.clear_all()
+                    await self._phase2_session_details(context, grid_sessions)
+                    await self._phase3_speaker_profiles(context, speaker_slugs)
 
-                self.db.update_last_sync()
-                self.db.commit()
+                    self.db.update_last_sync()
                 self.log(f"Sync complete. {self.db.session_count()} sessions in database.")
             finally:
                 await browser.close()
 
+    @staticmethod
+    async def _block_heavy_resources(route):
+        """Abort requests for resources the extractors never read."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _goto(self, page, url: str):
+        """Navigate to url once the shared rate limiter grants a request slot."""
+        await self._rate_limiter.wait()
+        await page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+
+    async def _fetch_all(
+        self,
+        context,
+        items: list[str],
+        fetch_one: Callable[[object, str], Awaitable[None]],
+        label: str,
+    ):
+        """Run fetch_one(page, item) for every item over a bounded pool of pages.
+
+        The pool size caps how many pages are in flight; the rate limiter keeps
+        request starts spaced by POLITENESS_DELAY. DB writes happen on the event
+        loop thread between awaits, so concurrent tasks never interleave them.
+        """
+        total = len(items)
+        pages: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(self.concurrency, total)):
+            pages.put_nowait(await context.new_page())
+        done = 0
+
+        async def run(item: str):
+            nonlocal done
+            page = await pages.get()
+            try:
+                await fetch_one(page, item)
+            finally:
+                pages.put_nowait(page)
+            done += 1
+            if done % 20 == 0 or done == 1:
+                self.log(f"  {label} {done}/{total}...")
+
+        try:
+            await asyncio.gather(*(run(item) for item in items))
+        finally:
+            while not pages.empty():
+                await pages.get_nowait().close()
+
     async def _phase1_schedule_grid(self, page) -> tuple[dict[str, dict], set[str]]:
         """Phase 1: Extract all schedule data from the grid via JS evaluation."""
         self.log("Phase 1: Loading schedule grid...")
-        await page.goto(SCHEDULE_URL, wait_until="networkidle", timeout=30000)
+        await page.goto(SCHEDULE_URL, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
         await page.wait_for_selector(".schedule-day", timeout=10000)
 
         result = await page.evaluate(GRID_EXTRACTION_JS)
@@ -167,9 +443,7 @@ class ConFooScraper:
                     existing["start_time"] = s["start_time"]
                 if s["end_time"] > existing["end_time"]:
                     existing["end_time"] = s["end_time"]
-                for t in s.get("tracks", []):
-                    if t not in existing["tracks"]:
-                        existing["tracks"].append(t)
+                existing["tracks"].update(dict.fromkeys(s.get("tracks", [])))
             else:
                 grid_sessions[slug] = {
                     "slug": slug,
@@ -181,145 +455,88 @@ class ConFooScraper:
                     "speaker_slug": s.get("speaker_slug", ""),
                     "speaker_name": s.get("speaker_name", ""),
                     "is_keynote": s.get("is_keynote", False),
-                    "tracks": list(s.get("tracks", [])),
+                    # Insertion-ordered set; converted back to a list below
+                    "tracks": dict.fromkeys(s.get("tracks", [])),
                 }
 
-        for event in events:
-            self.db.upsert_special_event(SpecialEvent(
+        for grid in grid_sessions.values():
+            grid["tracks"] = list(grid["tracks"])
+
+        self.db.upsert_special_events([
+            SpecialEvent(
                 day=event["day"],
                 start_time=event["start_time"],
                 end_time=event["end_time"],
                 name=event["name"],
-            ))
+            )
+            for event in events
+        ])
 
-        self.db.commit()
         self.log(f"  {len(grid_sessions)} unique sessions, {len(speaker_slugs)} unique speakers, {len(events)} events")
         return grid_sessions, speaker_slugs
 
-    async def _phase2_session_details(self, page, grid_sessions: dict[str, dict]):
-        """Phase 2: Fetch abstracts and language/level from session detail pages."""
+    async def _phase2_session_details(self, context, grid_sessions: dict[str, dict]):
+        """Phase 2: Fetch abstracts and language/level from session detail pages.
+
+        Every slug's page is fetched, since language and level differ between
+        runs of the same session (e.g. a training given in English and French).
+        Sessions sharing a title and a known speaker share their abstract, so a
+        page that yields none borrows the abstract of a sibling run.
+        """
         slugs = list(grid_sessions.keys())
-        total = len(slugs)
-        self.log(f"Phase 2: Scraping {total} session detail pages...")
+        self.log(f"Phase 2: Scraping {len(slugs)} session detail pages...")
+
+        pending: list[Session] = []
+        abstracts: dict[tuple[str, str], str] = {}
+        missing_abstract: list[Session] = []
 
-        for i, slug in enumerate(slugs, 1):
-            if i % 20 == 0 or i == 1:
-                self.log(f"  Session {i}/{total}...")
+        async def fetch(page, slug: str):
             url = f"{BASE_URL}/en/2026/session/{slug}"
             grid = grid_sessions[slug]
 
-            detail = None
-            try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=15000)
-                detail = await self._extract_session_detail(page)
-
-                if grid.get("speaker_slug"):
-                    if detail.get("speaker_company"):
-                        self._speaker_companies[grid["speaker_slug"]] = detail["speaker_company"]
-                    if detail.get("speaker_bio"):
-                        self._speaker_bios[grid["speaker_slug"]] = detail["speaker_bio"]
-            except Exception as e:
-                self.log(f"  Error scraping {url}: {e}")
-
-            self.db.upsert_session(self._session_from_grid(slug, grid, detail))
-
-            if i % 50 == 0:
-                self.db.commit()
-
-            await asyncio.sleep(POLITENESS_DELAY)
-
-        self.db.commit()
+            detail = self.cache.get(url) if self.cache else None
+            if detail is None:
+                try:
+                    await self._goto(page, url)
+                    detail = await self._extract_session_detail(page)
+                    if self.cache:
+                        self.cache.put(url, detail)
+                except Exception as e:
+                    self.log(f"  Error scraping {url}: {e}")
+
+            if detail and grid.get("speaker_slug"):
+                self._remember_session_speaker(grid, detail)
+
+            session = self._session_from_grid(slug, grid, detail)
+            if session.speaker_slug:
+                if session.abstract:
+                    abstracts.setdefault((session.title, session.speaker_slug), session.abstract)
+                else:
+                    missing_abstract.append(session)
+            pending.append(session)
+            if len(pending) >= WRITE_BATCH_SIZE:
+                self.db.upsert_sessions(pending)
+                pending.clear()
+
+        await self._fetch_all(context, slugs, fetch, "Session")
+
+        borrowed = []
+        for session in missing_abstract:
+            abstract = abstracts.get((session.title, session.speaker_slug))
+            if abstract:
+                session.abstract = abstract
+                borrowed.append(session)
+        # Sessions still pending already carry the borrowed abstract
+        queued = {id(s) for s in pending}
+        pending.extend(s for s in borrowed if id(s) not in queued)
+        self.db.upsert_sessions(pending)
+        if borrowed:
+            self.log(f"  {len(borrowed)} sessions reused the abstract of a sibling run")
         self.log(f"  Done. {self.db.session_count()} sessions saved.")
 
     async def _extract_session_detail(self, page) -> dict:
-        """Extract abstract, language, and level from a session detail page."""
-        result = await page.evaluate("""
-        () => {
-            let abstract = '';
-            let language = '';
-            let level = '';
-
-            // Parse language and level from paragraphs
-            const paragraphs = document.querySelectorAll('p');
-            for (const p of paragraphs) {
-                const text = p.textContent.trim();
-                if (text.match(/(English|French)\\s+(session|training)/i)) {
-                    const langMatch = text.match(/(English|French)/i);
-                    if (langMatch) language = langMatch[1];
-                    const levelMatch = text.match(/(Beginner|Intermediate|Advanced)/i);
-                    if (levelMatch) level = levelMatch[1];
-                    break;
-                }
-            }
-
-            // Abstract: find content divs nested in the main content area
-            const selectors = [
-                '.content > div > div > div > div',
-                '.col-md-12 > div > div > div > div'
-            ];
-            for (const sel of selectors) {
-                const divs = document.querySelectorAll(sel);
-                for (const div of divs) {
-                    if (div.querySelector('h2') || div.querySelector('a[href*="share"]')) continue;
-                    const text = div.textContent.trim();
-                    if (text.length > 50 &&
-                        !text.includes('View all') &&
-                        !text.includes('Share on') &&
-                        !text.includes('Other training')) {
-                        abstract = text;
-                        break;
-                    }
-                }
-                if (abstract) break;
-            }
-
-            // Fallback: search for any substantial text div
-            if (!abstract) {
-                const content = document.querySelector('.content');
-                if (content) {
-                    const deepDivs = content.querySelectorAll('div');
-                    for (const div of deepDivs) {
-                        if (div.children.length > 3) continue;
-                        const text = div.textContent.trim();
-                        if (text.length > 80 &&
-                            !text.includes('View all') &&
-                            !text.includes('Share on') &&
-                            !text.includes('Home /') &&
-                            !text.includes('Sponsored by') &&
-                            !text.includes('Other training') &&
-                            !div.querySelector('h2')) {
-                            abstract = text;
-                            break;
-                        }
-                    }
-                }
-            }
-
-            // Speaker info from the speaker section on session page
-            let speakerCompany = '';
-            let speakerBio = '';
-            const h2s = document.querySelectorAll('h2');
-            for (const h2 of h2s) {
-                const parent = h2.parentElement;
-                if (!parent) continue;
-                const speakerLink = parent.querySelector('a[href*="/speaker/"]');
-                if (!speakerLink) continue;
-                const paras = parent.querySelectorAll('p');
-                for (const p of paras) {
-                    const text = p.textContent.trim();
-                    if (text.includes('Read More') || text.length < 3) continue;
-                    if (!speakerCompany && text.length < 120) {
-                        speakerCompany = text;
-                    } else if (!speakerBio && text.length > 50) {
-                        speakerBio = text;
-                    }
-                }
-                break;
-            }
-
-            return { abstract, language, level, speaker_company: speakerCompany, speaker_bio: speakerBio };
-        }
-        """)
+        """Extract abstract, language, level, and the speaker summary from a session detail page."""
+        result = await page.evaluate(SESSION_DETAIL_JS)
 
         return {
             "abstract": result.get("abstract", ""),
@@ -327,101 +544,85 @@ class ConFooScraper:
             "level": result.get("level", ""),
             "speaker_company": result.get("speaker_company", ""),
             "speaker_bio": result.get("speaker_bio", ""),
+            "speaker_country": result.get("speaker_country", ""),
+            "speaker_photo_url": result.get("speaker_photo_url", ""),
+            "speaker_twitter": result.get("speaker_twitter", ""),
         }
 
-    async def _phase3_speaker_profiles(self, page, speaker_slugs: set[str]):
-        """Phase 3: Scrape individual speaker profile pages."""
-        slugs = sorted(speaker_slugs)
-        total = len(slugs)
-        self.log(f"Phase 3: Scraping {total} speaker profiles...")
+    def _remember_session_speaker(self, grid: dict, detail: dict):
+        """Merge the speaker summary from a session page into what phase 3 will need."""
+        slug = grid["speaker_slug"]
+        known = self._session_speakers.setdefault(
+            slug, Speaker(slug=slug, name=grid.get("speaker_name", ""))
+        )
+        known.company = known.company or detail.get("speaker_company", "")
+        known.bio = known.bio or detail.get("speaker_bio", "")
+        known.country = known.country or detail.get("speaker_country", "")
+        known.photo_url = known.photo_url or detail.get("speaker_photo_url", "")
+        known.twitter = known.twitter or detail.get("speaker_twitter", "")
+
+    @staticmethod
+    def _is_complete(speaker: Speaker | None) -> bool:
+        """Whether session pages already gave every field a profile page would.
+
+        Twitter is optional: many speakers have none, and a profile page visit
+        would not find one either.
+        """
+        return bool(
+            speaker and speaker.name and speaker.bio and speaker.country
+            and speaker.photo_url
+        )
+
+    async def _phase3_speaker_profiles(self, context, speaker_slugs: set[str]):
+        """Phase 3: Scrape speaker profile pages not already covered by session pages."""
+        complete = [s for s in sorted(speaker_slugs) if self._is_complete(self._session_speakers.get(s))]
+        self.db.upsert_speakers([self._session_speakers[s] for s in complete])
+        slugs = sorted(speaker_slugs.difference(complete))
+        self.log(
+            f"Phase 3: Scraping {len(slugs)} speaker profiles "
+            f"({len(complete)} already complete from session pages)..."
+        )
+
+        pending: list[Speaker] = []
 
-        for i, slug in enumerate(slugs, 1):
-            if i % 20 == 0 or i == 1:
-                self.log(f"  Speaker {i}/{total}...")
+        async def fetch(page, slug: str):
             url = f"{BASE_URL}/en/speaker/{slug}"
             try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=15000)
-                speaker = await self._extract_speaker(page, slug)
-                company = self._speaker_companies.get(slug, "")
-                if company:
-                    speaker.company = company
-                if not speaker.bio:
-                    speaker.bio = self._speaker_bios.get(slug, "")
-                self.db.upsert_speaker(speaker)
-                if i % 50 == 0:
-                    self.db.commit()
+                speaker = None
+                cached = self.cache.get(url) if self.cache else None
+                if cached is not None:
+                    try:
+                        speaker = Speaker(**cached)
+                    except TypeError:
+                        # Entry written by an older Speaker layout; refetch it.
+                        speaker = None
+                if speaker is None:
+                    await self._goto(page, url)
+                    speaker = await self._extract_speaker(page, slug)
+                    if self.cache:
+                        self.cache.put(url, asdict(speaker))
+                known = self._session_speakers.get(slug)
+                if known:
+                    if known.company:
+                        speaker.company = known.company
+                    speaker.bio = speaker.bio or known.bio
+                    speaker.country = speaker.country or known.country
+                    speaker.photo_url = speaker.photo_url or known.photo_url
+                    speaker.twitter = speaker.twitter or known.twitter
+                pending.append(speaker)
+                if len(pending) >= WRITE_BATCH_SIZE:
+                    self.db.upsert_speakers(pending)
+                    pending.clear()
             except Exception as e:
                 self.log(f"  Error scraping {url}: {e}")
 
-            await asyncio.sleep(POLITENESS_DELAY)
-
-        self.db.commit()
+        await self._fetch_all(context, slugs, fetch, "Speaker")
+        self.db.upsert_speakers(pending)
         self.log(f"  Done. Speaker profiles saved.")
 
     async def _extract_speaker(self, page, slug: str) -> Speaker:
         """Extract speaker profile from a speaker page using JS evaluation."""
-        result = await page.evaluate("""
-        () => {
-            const h1 = document.querySelector('h1');
-            const name = h1 ? h1.textContent.trim() : '';
-
-            // Country: look for a span inside a paragraph (flag + country name)
-            let country = '';
-            const content = document.querySelector('.content') || document.querySelector('main');
-            if (content) {
-                const paras = content.querySelectorAll('p');
-                for (const p of paras) {
-                    const span = p.querySelector('span');
-                    if (span) {
-                        const text = span.textContent.trim();
-                        if (text.length > 2 && text.length < 50 &&
-                            !text.includes('session') && !text.includes('training')) {
-                            country = text;
-                            break;
-                        }
-                    }
-                }
-            }
-
-            // Bio: find the first substantial paragraph text
-            let bio = '';
-            if (content) {
-                const paras = content.querySelectorAll('p');
-                for (const p of paras) {
-                    const text = p.textContent.trim();
-                    if (text.length > 50 &&
-                        !text.match(/session\\s*-|training\\s*-/i) &&
-                        !text.includes('Share on') &&
-                        !text.includes('Read More') &&
-                        !text.includes(country)) {
-                        bio = text;
-                        break;
-                    }
-                }
-            }
-
-            // Photo: image with speaker name as alt
-            let photo_url = '';
-            if (name) {
-                const img = document.querySelector('img[alt="' + name.replace(/"/g, '\\\\"') + '"]');
-                if (img) photo_url = img.src || '';
-            }
-
-            // Social links
-            let twitter = '';
-            const links = document.querySelectorAll('a[href]');
-            for (const a of links) {
-                const href = a.getAttribute('href') || '';
-                if ((href.includes('twitter.com') || href.includes('x.com/')) &&
-                    !href.includes('intent/tweet') && !href.includes('confooca')) {
-                    twitter = href;
-                    break;
-                }
-            }
-
-            return { name, country, bio, photo_url, twitter };
-        }
-        """)
+        result = await page.evaluate(SPEAKER_JS)
 
         return Speaker(
             slug=slug,
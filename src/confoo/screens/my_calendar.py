@@ -1,4 +1,3 @@
-from functools import partial
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -8,6 +7,7 @@ from textual.containers import Vertical
 from textual.binding import Binding
 
 from confoo.models import Session
+from confoo.screens.session_detail import SessionDetailScreen
 from confoo.day_utils import day_number, day_sort_key, time_sort_key, format_time_range, DAY_LABELS
 
 
@@ -21,6 +21,13 @@ class MyCalendarScreen(Screen):
         Binding("escape", "go_back", "Back", show=True),
     ]
 
+    def __init__(self):
+        super().__init__()
+        self._by_day: dict[str, list[Session]] = {}
+        self._conflicts: dict[str, list[str]] = {}
+        self._tables: dict[str, DataTable] = {}
+        self._rendered: dict[str, list[tuple[str, str]]] = {}
+
     def compose(self) -> ComposeResult:
         yield Header()
         with Vertical(id="calendar-content"):
@@ -29,6 +36,8 @@ class MyCalendarScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
+        self._header = self.query_one("#calendar-header", Static)
+        self._tabs = self.query_one("#cal-tabs", TabbedContent)
         self._load_data()
 
     def on_screen_resume(self) -> None:
@@ -42,10 +51,22 @@ class MyCalendarScreen(Screen):
         conflicts = cal.find_conflicts(all_sessions)
         return selected, conflicts
 
+    def _index_by_day(self, selected: list[Session], conflicts: dict[str, list[str]]):
+        """Group selected sessions by day number, each bucket sorted by start time.
+
+        Tab switches read from this index instead of re-filtering the selection.
+        """
+        by_day: dict[str, list[Session]] = {}
+        for s in selected:
+            by_day.setdefault(day_number(s.day), []).append(s)
+        for sessions in by_day.values():
+            sessions.sort(key=lambda s: time_sort_key(s.start_time))
+        self._by_day = by_day
+        self._conflicts = conflicts
+
     def _update_header(self, count: int, conflict_count: int):
         """Update the calendar header with session and conflict counts."""
-        header = self.query_one("#calendar-header", Static)
-        header.update(
+        self._header.update(
             f"[bold]My Calendar[/bold] - {count} session{'s' if count != 1 else ''}"
             + (f" - [red]{conflict_count} conflict{'s' if conflict_count != 1 else ''}[/red]" if conflict_count else "")
         )
@@ -53,13 +74,16 @@ class MyCalendarScreen(Screen):
     def _load_data(self):
         """Build calendar view from selected sessions."""
         selected, conflicts = self._get_calendar_data()
+        self._index_by_day(selected, conflicts)
         self._update_header(len(selected), len(conflicts))
 
         days = sorted({s.day for s in selected if s.day}, key=day_sort_key)
-        tabs = self.query_one("#cal-tabs", TabbedContent)
+        tabs = self._tabs
 
         for pane in list(tabs.query("TabPane")):
             tabs.remove_pane(pane.id)
+        self._tables.clear()
+        self._rendered.clear()
 
         for day in days:
             num = day_number(day)
@@ -71,56 +95,68 @@ class MyCalendarScreen(Screen):
         if days:
             first_num = day_number(days[0])
             tabs.active = f"cal-day-{first_num}"
-            self.call_later(partial(self._populate_tab, selected, conflicts))
+            self.call_later(self._populate_tab)
 
     def _refresh(self):
         """Refresh the calendar display."""
         selected, conflicts = self._get_calendar_data()
+        self._index_by_day(selected, conflicts)
         self._update_header(len(selected), len(conflicts))
-        self._populate_tab(selected, conflicts)
+        self._populate_tab()
 
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
-        selected, conflicts = self._get_calendar_data()
-        self.call_later(partial(self._populate_tab, selected, conflicts))
+        self.call_later(self._populate_tab)
+
+    def _populate_tab(self):
+        """Populate the DataTable for the active tab from the day index.
 
-    def _populate_tab(self, selected: list[Session], conflicts: dict[str, list[str]]):
-        """Populate the DataTable for the active tab."""
-        tabs = self.query_one("#cal-tabs", TabbedContent)
-        active_id = tabs.active
+        Rows already on screen are kept: an unchanged day is skipped, and when
+        sessions were only removed the table is patched in place. Additions
+        rebuild the table so rows stay in start-time order.
+        """
+        active_id = self._tabs.active
         if not active_id:
             return
 
         day_num = active_id.replace("cal-day-", "")
-        pane = tabs.query_one(f"#{active_id}", TabPane)
-
-        existing = pane.query("DataTable")
-        if existing:
-            table = existing.first()
-        else:
+        table = self._tables.get(active_id)
+        if table is None:
+            pane = self._tabs.query_one(f"#{active_id}", TabPane)
             table = DataTable(id=f"cal-table-{day_num}")
             pane.mount(table)
             table.add_columns("Time", "Title", "Speaker", "Room", "Status")
             table.cursor_type = "row"
+            self._tables[active_id] = table
+
+        conflicts = self._conflicts
+        day_sessions = self._by_day.get(day_num, [])
+        rows = [
+            (s.slug, "[CONFLICT]" if s.slug in conflicts else "✓")
+            for s in day_sessions
+        ]
+        rendered = self._rendered.get(day_num)
+        if rows == rendered:
+            return
 
-        table.clear()
-
-        day_sessions = sorted(
-            [s for s in selected if day_number(s.day) == day_num],
-            key=lambda s: time_sort_key(s.start_time),
-        )
-
-        for session in day_sessions:
-            time_str = format_time_range(session.start_time, session.end_time)
-
-            status = "✓"
-            if session.slug in conflicts:
-                status = "[CONFLICT]"
-
-            table.add_row(
-                time_str, session.title, session.speaker_name,
-                session.room, status,
-                key=session.slug,
-            )
+        desired = dict(rows)
+        with self.app.batch_update():
+            if rendered is not None and desired.keys() <= {slug for slug, _ in rendered}:
+                status_key = table.ordered_columns[-1].key
+                for slug, status in rendered:
+                    if slug not in desired:
+                        table.remove_row(slug)
+                    elif desired[slug] != status:
+                        table.update_cell(slug, status_key, desired[slug])
+            else:
+                table.clear()
+                for session in day_sessions:
+                    time_str = format_time_range(session.start_time, session.end_time)
+                    table.add_row(
+                        time_str, session.title, session.speaker_name,
+                        session.room, desired[session.slug],
+                        key=session.slug,
+                    )
+        self._rendered[day_num] = rows
 
     def action_remove_session(self) -> None:
         table = self._get_active_table()
@@ -151,17 +187,14 @@ class MyCalendarScreen(Screen):
             return
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         slug = row_key.value
-        from confoo.screens.session_detail import SessionDetailScreen
         self.app.push_screen(SessionDetailScreen(slug))
 
     def action_go_back(self) -> None:
+        self.app.calendar_manager.flush()
         self.app.pop_screen()
 
     def _get_active_table(self) -> DataTable | None:
-        tabs = self.query_one("#cal-tabs", TabbedContent)
-        active_id = tabs.active
+        active_id = self._tabs.active
         if not active_id:
             return None
-        pane = tabs.query_one(f"#{active_id}", TabPane)
-        tables = pane.query("DataTable")
-        return tables.first() if tables else None
+        return self._tables.get(active_id)
@@ -1,12 +1,23 @@
+from itertools import islice
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, DataTable, Input, Label, Static, TabbedContent, TabPane
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
+from textual.timer import Timer
 from rich.text import Text
 
 from confoo.models import Session
-from confoo.day_utils import day_number, day_sort_key, make_tab_label, time_sort_key, format_time_range, CONFERENCE_DAYS, DAY_LABELS
+from confoo.screens.session_detail import SessionDetailScreen
+from confoo.day_utils import day_index, day_number, day_sort_key, make_tab_label, time_sort_key, format_time_range, CONFERENCE_DAYS, DAY_LABELS
+
+SEARCH_DEBOUNCE_SECONDS = 0.15
+ROW_CHUNK_SIZE = 50
+MAX_SEARCH_RESULTS = 200
+
+_CAL_CHECK = Text("✓", style="bold green")
+_CAL_EMPTY = Text("")
 
 
 class ScheduleScreen(Screen):
@@ -23,10 +34,21 @@ class ScheduleScreen(Screen):
     def __init__(self):
         super().__init__()
         self._sessions: list[Session] = []
+        self._sessions_by_day: dict[str, list[Session]] = {}
+        self._search_index: list[tuple[str, Session]] = []
+        self._time_ranges: dict[str, str] = {}
+        self._day_labels: dict[str, str] = {}
+        self._rating_displays: dict[str, str] = {}
+        self._slugs_by_track: dict[str, set[str]] = {}
         self._days: list[str] = []
         self._tracks: list[str] = []
         self._current_track_idx: int = -1
         self._search_text: str = ""
+        self._search_timer: Timer | None = None
+        self._fill_generation: int = 0
+        self._panes: dict[str, TabPane] = {}
+        self._tables: dict[str, DataTable] = {}
+        self._tab_track_idx: dict[str, int] = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -40,7 +62,11 @@ class ScheduleScreen(Screen):
         yield Footer()
 
     def on_mount(self) -> None:
-        search_table = self.query_one("#search-results", DataTable)
+        self._search_table = self.query_one("#search-results", DataTable)
+        self._tabs = self.query_one("#day-tabs", TabbedContent)
+        self._search_input = self.query_one("#search-input", Input)
+        self._track_label = self.query_one("#track-filter", Static)
+        search_table = self._search_table
         search_table.display = False
         search_table.add_columns("Cal", "Day", "Time", "Title", "Speaker", "Track", "Room", "Rating")
         search_table.cursor_type = "row"
@@ -49,21 +75,27 @@ class ScheduleScreen(Screen):
     def _load_data(self):
         """Load sessions from the data loader."""
         loader = self.app.data_loader
-        self._sessions = loader.get_all_sessions()
+        # sorted() rather than list.sort(): the JSON loader hands out its own list
+        self._sessions = sorted(
+            loader.get_all_sessions(),
+            key=lambda s: (day_sort_key(s.day), time_sort_key(s.start_time)),
+        )
+        self._index_sessions()
         self._days = sorted(loader.get_all_days(), key=day_sort_key)
         self._tracks = loader.get_all_tracks()
 
-        tabs = self.query_one("#day-tabs", TabbedContent)
+        tabs = self._tabs
         for day in self._days:
             label = make_tab_label(day)
             tab_id = f"day-{day_number(day)}"
             pane = TabPane(label, id=tab_id)
             tabs.add_pane(pane)
+            self._panes[tab_id] = pane
 
         if self._days:
             first_conf = None
             for day in self._days:
-                if day_number(day) in CONFERENCE_DAYS:
+                if day_index(day) in CONFERENCE_DAYS:
                     first_conf = day
                     break
             target = first_conf or self._days[0]
@@ -71,32 +103,118 @@ class ScheduleScreen(Screen):
             tabs.active = tab_id
             self.call_later(self._populate_active_tab)
 
-    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
-        self.call_later(self._populate_active_tab)
-
-    def _build_session_row(self, session: Session) -> tuple:
-        """Build the common row fields for a session: (cal, time, title, speaker, track, room, rating)."""
+    def _index_sessions(self):
+        """Precompute everything the tables derive from the (immutable) session list.
+
+        self._sessions is already in day and start-time order, and every index
+        built from it inherits that order, so neither day tabs nor search results
+        sort anything. Lowercased search text, time ranges, day labels and rating
+        text are kept in side tables keyed by slug, since the slotted Session
+        model has no room for cached attributes.
+        """
+        ordered = self._sessions
+        by_day: dict[str, list[Session]] = {}
+        for s in ordered:
+            by_day.setdefault(day_number(s.day), []).append(s)
+        self._sessions_by_day = by_day
+        self._search_index = [
+            ((s.title + "\x00" + s.speaker_name).lower(), s) for s in ordered
+        ]
+        self._time_ranges = {
+            s.slug: format_time_range(s.start_time, s.end_time) for s in ordered
+        }
+        self._day_labels = {
+            s.slug: DAY_LABELS.get(day_number(s.day), s.day[:10]) for s in ordered
+        }
         ratings = self.app.speaker_ratings
-        calendar = self.app.calendar_manager
+        self._rating_displays = {
+            s.slug: ratings[s.speaker_slug].display if s.speaker_slug in ratings else ""
+            for s in ordered
+        }
+        by_track: dict[str, set[str]] = {}
+        for s in ordered:
+            for t in s.tracks:
+                by_track.setdefault(t, set()).add(s.slug)
+        self._slugs_by_track = by_track
 
-        time_str = format_time_range(session.start_time, session.end_time)
-        track = session.tracks[0] if session.tracks else ""
-        rating_info = ratings.get(session.speaker_slug)
-        rating_display = rating_info.display if rating_info else ""
-        cal_mark = Text("✓", style="bold green") if calendar.is_selected(session.slug) else Text("")
-        title = f"[KEYNOTE] {session.title}" if session.is_keynote else session.title
+    def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        self.call_later(self._populate_active_tab)
 
-        return (cal_mark, time_str, title, session.speaker_name, track, session.room, rating_display)
+    def _session_row_builder(self):
+        """Return a row builder with the app lookups hoisted out of the per-row path.
+
+        Rows are (cal, time, title, speaker, track, room, rating). The calendar
+        selection is captured as a frozenset snapshot, so build one per batch
+        of rows rather than holding it across calendar changes.
+        """
+        selected = self.app.calendar_manager.selected_slugs
+        time_ranges = self._time_ranges
+        rating_displays = self._rating_displays
+
+        def build_row(session: Session) -> tuple:
+            time_str = time_ranges[session.slug]
+            track = session.tracks[0] if session.tracks else ""
+            rating_display = rating_displays[session.slug]
+            cal_mark = _CAL_CHECK if session.slug in selected else _CAL_EMPTY
+            title = f"[KEYNOTE] {session.title}" if session.is_keynote else session.title
+            return (cal_mark, time_str, title, session.speaker_name, track, session.room, rating_display)
+
+        return build_row
+
+    def _search_row_builder(self):
+        """Return a search results row builder: the common fields with the day label after cal."""
+        build_row = self._session_row_builder()
+        day_labels = self._day_labels
+
+        def build_search_row(session: Session) -> tuple:
+            cal, time_str, title, speaker, track, room, rating = build_row(session)
+            return (cal, day_labels[session.slug], time_str, title, speaker, track, room, rating)
+
+        return build_search_row
+
+    def _fill_table(self, table: DataTable, sessions: list[Session], make_row_builder, on_complete=None):
+        """Clear table and add rows for sessions in chunks of ROW_CHUNK_SIZE.
+
+        The first chunk covers the visible rows and is added immediately; the
+        rest follow one chunk per refresh so large days and searches never block
+        input. Starting a new fill abandons chunks still pending from the last.
+        Each chunk (the first together with the clear) is one batched update,
+        built with a fresh row builder so it reflects the current selection.
+        on_complete is called once the last chunk has been added.
+        """
+        self._fill_generation += 1
+        generation = self._fill_generation
+
+        def add_chunk(start: int):
+            if generation != self._fill_generation:
+                return
+            build_row = make_row_builder()
+            rows = [(build_row(s), s.slug) for s in sessions[start:start + ROW_CHUNK_SIZE]]
+            with self.app.batch_update():
+                if start == 0:
+                    table.clear()
+                for cells, slug in rows:
+                    table.add_row(*cells, key=slug)
+            if start + ROW_CHUNK_SIZE < len(sessions):
+                self.call_after_refresh(add_chunk, start + ROW_CHUNK_SIZE)
+            elif on_complete is not None:
+                on_complete()
+
+        add_chunk(0)
 
     def _populate_active_tab(self):
-        """Populate the DataTable for the currently active day tab."""
+        """Populate the DataTable for the currently active day tab.
+
+        A day table that was fully filled under the current track filter is kept
+        as is; only its Cal marks are reconciled with the calendar.
+        """
         if self._search_text:
             self._populate_search_results()
             return
 
-        search_table = self.query_one("#search-results", DataTable)
-        search_table.display = False
-        tabs = self.query_one("#day-tabs", TabbedContent)
+        self._search_table.display = False
+        self.sub_title = None
+        tabs = self._tabs
         tabs.display = True
 
         active_id = tabs.active
@@ -104,74 +222,84 @@ class ScheduleScreen(Screen):
             return
 
         day_num = active_id.replace("day-", "")
-        pane = tabs.query_one(f"#{active_id}", TabPane)
-
-        existing = pane.query("DataTable")
-        if existing:
-            table = existing.first()
-        else:
+        table = self._tables.get(active_id)
+        if table is None:
             table = DataTable(id=f"table-{day_num}")
-            pane.mount(table)
+            self._panes[active_id].mount(table)
             table.add_columns("Cal", "Time", "Title", "Speaker", "Track", "Room", "Rating")
             table.cursor_type = "row"
+            self._tables[active_id] = table
 
-        table.clear()
-        for session in self._get_filtered_sessions(day_num):
-            table.add_row(*self._build_session_row(session), key=session.slug)
+        track_idx = self._current_track_idx
+        if self._tab_track_idx.get(day_num) == track_idx:
+            self._fill_generation += 1  # drop chunks pending for a hidden table
+            self.refresh_schedule()
+            return
+
+        def mark_filled():
+            self._tab_track_idx[day_num] = track_idx
+
+        self._tab_track_idx.pop(day_num, None)
+        self._fill_table(
+            table, self._get_filtered_sessions(day_num), self._session_row_builder, mark_filled
+        )
 
     def _populate_search_results(self):
         """Populate the cross-day search results table."""
-        tabs = self.query_one("#day-tabs", TabbedContent)
-        tabs.display = False
-        search_table = self.query_one("#search-results", DataTable)
+        self._tabs.display = False
+        search_table = self._search_table
         search_table.display = True
-        search_table.clear()
 
+        # The index is already in day/time order, so matches stream out sorted
+        # and can stop once the display cap (plus one, to detect truncation) is hit.
         query = self._search_text.lower()
-        sessions = [
-            s for s in self._sessions
-            if query in s.title.lower() or query in s.speaker_name.lower()
-        ]
-
-        if self._current_track_idx >= 0:
-            track = self._tracks[self._current_track_idx]
-            sessions = [s for s in sessions if track in s.tracks]
-
-        sessions.sort(key=lambda s: (day_sort_key(s.day), time_sort_key(s.start_time)))
+        slugs = self._selected_track_slugs()
+        matches = (
+            s for blob, s in self._search_index
+            if query in blob and (slugs is None or s.slug in slugs)
+        )
+        sessions = list(islice(matches, MAX_SEARCH_RESULTS + 1))
+        if len(sessions) > MAX_SEARCH_RESULTS:
+            del sessions[MAX_SEARCH_RESULTS:]
+            self.sub_title = f"Showing first {MAX_SEARCH_RESULTS} matches"
+        else:
+            self.sub_title = None
 
-        for session in sessions:
-            cal, time_str, title, speaker, track, room, rating = self._build_session_row(session)
-            day_label = DAY_LABELS.get(day_number(session.day), session.day[:10])
-            search_table.add_row(
-                cal, day_label, time_str, title, speaker, track, room, rating,
-                key=session.slug,
-            )
+        self._fill_table(search_table, sessions, self._search_row_builder)
 
     def _get_filtered_sessions(self, day_num: str) -> list[Session]:
-        """Get sessions for a day, applying track filter and sorting by time."""
-        sessions = [
-            s for s in self._sessions
-            if day_number(s.day) == day_num
-        ]
-
-        if self._current_track_idx >= 0:
-            track = self._tracks[self._current_track_idx]
-            sessions = [s for s in sessions if track in s.tracks]
-
-        sessions.sort(key=lambda s: time_sort_key(s.start_time))
-        return sessions
+        """Get a day's time-sorted sessions from the day index, applying the track filter."""
+        sessions = self._sessions_by_day.get(day_num, [])
+        slugs = self._selected_track_slugs()
+        if slugs is None:
+            return sessions
+        return [s for s in sessions if s.slug in slugs]
+
+    def _selected_track_slugs(self) -> set[str] | None:
+        """Slugs in the selected track from the track index, or None for all tracks."""
+        if self._current_track_idx < 0:
+            return None
+        return self._slugs_by_track.get(self._tracks[self._current_track_idx], set())
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "search-input":
+            if event.value == self._search_text:
+                # Already applied, e.g. by action_clear_search
+                return
             self._search_text = event.value
-            self._populate_active_tab()
+            # Rebuild once typing pauses rather than on every keystroke
+            if self._search_timer is not None:
+                self._search_timer.stop()
+            self._search_timer = self.set_timer(SEARCH_DEBOUNCE_SECONDS, self._populate_active_tab)
 
     def action_focus_search(self) -> None:
-        self.query_one("#search-input", Input).focus()
+        self._search_input.focus()
 
     def action_clear_search(self) -> None:
-        inp = self.query_one("#search-input", Input)
-        inp.value = ""
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self._search_input.value = ""
         self._search_text = ""
         self._populate_active_tab()
 
@@ -182,11 +310,10 @@ class ScheduleScreen(Screen):
         if self._current_track_idx >= len(self._tracks):
             self._current_track_idx = -1
 
-        label = self.query_one("#track-filter", Static)
         if self._current_track_idx < 0:
-            label.update("All Tracks")
+            self._track_label.update("All Tracks")
         else:
-            label.update(self._tracks[self._current_track_idx])
+            self._track_label.update(self._tracks[self._current_track_idx])
         self._populate_active_tab()
 
     def action_toggle_attend(self) -> None:
@@ -195,8 +322,8 @@ class ScheduleScreen(Screen):
             return
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         slug = row_key.value
-        self.app.calendar_manager.toggle(slug)
-        self._populate_active_tab()
+        selected = self.app.calendar_manager.toggle(slug)
+        table.update_cell(row_key, table.ordered_columns[0].key, _CAL_CHECK if selected else _CAL_EMPTY)
 
     def action_view_detail(self) -> None:
         table = self._get_active_table()
@@ -204,28 +331,36 @@ class ScheduleScreen(Screen):
             return
         row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         slug = row_key.value
-        from confoo.screens.session_detail import SessionDetailScreen
         self.app.push_screen(SessionDetailScreen(slug))
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         slug = event.row_key.value
-        from confoo.screens.session_detail import SessionDetailScreen
         self.app.push_screen(SessionDetailScreen(slug))
 
     def _get_active_table(self) -> DataTable | None:
         """Get the currently visible DataTable (search results or day tab)."""
-        search_table = self.query_one("#search-results", DataTable)
-        if search_table.display:
-            return search_table
+        if self._search_table.display:
+            return self._search_table
 
-        tabs = self.query_one("#day-tabs", TabbedContent)
-        active_id = tabs.active
+        active_id = self._tabs.active
         if not active_id:
             return None
-        pane = tabs.query_one(f"#{active_id}", TabPane)
-        tables = pane.query("DataTable")
-        return tables.first() if tables else None
+        return self._tables.get(active_id)
+
+    def on_screen_resume(self) -> None:
+        self.refresh_schedule()
 
     def refresh_schedule(self):
-        """Called when returning from detail screen or after calendar change."""
-        self._populate_active_tab()
+        """Called when returning from detail screen or after calendar change.
+
+        Only Cal cells whose selection changed are rewritten; rows are kept.
+        """
+        table = self._get_active_table()
+        if not table or table.row_count == 0:
+            return
+        selected = self.app.calendar_manager.selected_slugs
+        cal_key = table.ordered_columns[0].key
+        for row_key in list(table.rows):
+            mark = _CAL_CHECK if row_key.value in selected else _CAL_EMPTY
+            if table.get_cell(row_key, cal_key) is not mark:
+                table.update_cell(row_key, cal_key, mark)
@@ -1,6 +1,6 @@
 from textual.app import ComposeResult
 from textual.screen import Screen
-from textual.widgets import Header, Footer, Static, Label
+from textual.widgets import Header, Footer, Static
 from textual.containers import VerticalScroll
 from textual.binding import Binding
 
@@ -41,65 +41,60 @@ class SessionDetailScreen(Screen):
         is_attending = cal.is_selected(session.slug)
         attend_text = "[bold green]✓ In your calendar[/]" if is_attending else "[dim]Not in your calendar[/dim]"
 
-        container.mount(Static(f"[bold]{session.title}[/bold]"))
-
-        meta_parts = []
+        # Markup is assembled into three Statics (header, attendance, body) and
+        # mounted in one call, so opening the screen costs a single layout pass.
+        header_lines = [f"[bold]{session.title}[/bold]"]
         if session.day:
-            meta_parts.append(f"[bold]Day:[/bold] {session.day}")
+            header_lines.append(f"[bold]Day:[/bold] {session.day}")
         if session.start_time:
             time_str = format_time_range(session.start_time, session.end_time, separator=" - ")
-            meta_parts.append(f"[bold]Time:[/bold] {time_str}")
+            header_lines.append(f"[bold]Time:[/bold] {time_str}")
         if session.room:
-            meta_parts.append(f"[bold]Room:[/bold] {session.room}")
+            header_lines.append(f"[bold]Room:[/bold] {session.room}")
         if session.language:
-            meta_parts.append(f"[bold]Language:[/bold] {session.language}")
+            header_lines.append(f"[bold]Language:[/bold] {session.language}")
         if session.level:
-            meta_parts.append(f"[bold]Level:[/bold] {session.level}")
+            header_lines.append(f"[bold]Level:[/bold] {session.level}")
         if session.tracks:
-            meta_parts.append(f"[bold]Tracks:[/bold] {', '.join(session.tracks)}")
+            header_lines.append(f"[bold]Tracks:[/bold] {', '.join(session.tracks)}")
         if session.is_keynote:
-            meta_parts.append("[bold yellow]KEYNOTE[/bold yellow]")
-        container.mount(Static("\n".join(meta_parts)))
+            header_lines.append("[bold yellow]KEYNOTE[/bold yellow]")
 
         self._attend_widget = Static(attend_text)
-        container.mount(self._attend_widget)
 
+        body_lines = []
         if session.abstract:
-            container.mount(Static(""))
-            container.mount(Label("[bold]Abstract[/bold]"))
-            container.mount(Static(session.abstract))
+            body_lines += ["", "[bold]Abstract[/bold]", session.abstract]
 
         speaker = self.app.data_loader.get_speaker(session.speaker_slug) if session.speaker_slug else None
         if speaker or session.speaker_name:
-            container.mount(Static(""))
             name = speaker.name if speaker else session.speaker_name
-            container.mount(Static(f"[bold]Speaker: {name}[/bold]"))
+            body_lines += ["", f"[bold]Speaker: {name}[/bold]"]
 
             if speaker:
-                speaker_meta = []
                 if speaker.company:
-                    speaker_meta.append(f"[bold]Company:[/bold] {speaker.company}")
+                    body_lines.append(f"[bold]Company:[/bold] {speaker.company}")
                 if speaker.country:
-                    speaker_meta.append(f"[bold]Country:[/bold] {speaker.country}")
+                    body_lines.append(f"[bold]Country:[/bold] {speaker.country}")
                 if speaker.twitter:
-                    speaker_meta.append(f"[bold]Twitter:[/bold] {speaker.twitter}")
+                    body_lines.append(f"[bold]Twitter:[/bold] {speaker.twitter}")
                 if speaker.website:
-                    speaker_meta.append(f"[bold]Website:[/bold] {speaker.website}")
-                if speaker_meta:
-                    container.mount(Static("\n".join(speaker_meta)))
+                    body_lines.append(f"[bold]Website:[/bold] {speaker.website}")
 
                 if speaker.bio:
-                    container.mount(Static(""))
-                    container.mount(Label("[bold]Bio[/bold]"))
-                    container.mount(Static(speaker.bio))
+                    body_lines += ["", "[bold]Bio[/bold]", speaker.bio]
 
         rating = self.app.speaker_ratings.get(session.speaker_slug)
         if rating:
             rating_text = f"Speaker Rating: {rating.display} ({rating.badge})"
             if rating.note:
                 rating_text += f"\n{rating.note}"
-            container.mount(Static(""))
-            container.mount(Static(rating_text))
+            body_lines += ["", rating_text]
+
+        widgets = [Static("\n".join(header_lines)), self._attend_widget]
+        if body_lines:
+            widgets.append(Static("\n".join(body_lines)))
+        container.mount(*widgets)
 
     def action_toggle_attend(self) -> None:
         result = self.app.calendar_manager.toggle(self.session_slug)
@@ -112,4 +107,5 @@ class SessionDetailScreen(Screen):
             self._attend_widget.update(text)
 
     def action_go_back(self) -> None:
+        self.app.calendar_manager.flush()
         self.app.pop_screen()
@@ -1,9 +1,13 @@
+import asyncio
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Header, Footer, Static, Button, RichLog
 from textual.containers import Vertical
 from textual.binding import Binding
 
+LOG_FLUSH_INTERVAL = 1 / 30
+
 
 class SyncScreen(Screen):
     """Screen to trigger and monitor a full scrape sync."""
@@ -40,7 +44,7 @@ class SyncScreen(Screen):
             self._run_sync()
 
     def _run_sync(self):
-        """Run the sync in a worker thread."""
+        """Run the sync as an async worker on the app's event loop."""
         self.run_worker(self._do_sync(), exclusive=True)
 
     async def _do_sync(self):
@@ -48,31 +52,53 @@ class SyncScreen(Screen):
         log = self.query_one("#sync-log", RichLog)
         log.clear()
 
+        # Scraper messages are buffered and written in one batch per flush tick,
+        # so a chatty sync costs one RichLog update per frame, not per message.
+        pending: list[str] = []
+
+        def flush_log():
+            if pending:
+                log.write("\n".join(pending))
+                pending.clear()
+
         def log_msg(msg: str):
-            self.call_from_thread(log.write, msg)
+            pending.append(msg)
+
+        flush_timer = self.set_interval(LOG_FLUSH_INTERVAL, flush_log)
 
         try:
             from confoo.db import ConfooDB
             from confoo.scraper import ConFooScraper
+            from confoo.scrape_cache import ScrapeCache
             from confoo.export import export_json_snapshot
             from confoo.data_loader import DATA_DIR
 
+            def export_snapshot(json_path) -> bool:
+                # sqlite connections are bound to the thread that opened them,
+                # so the export thread opens its own.
+                with ConfooDB() as export_db:
+                    return export_json_snapshot(export_db, json_path)
+
             log_msg("Initializing database...")
-            with ConfooDB() as db:
-                scraper = ConFooScraper(db, log=log_msg)
+            with ConfooDB() as db, ScrapeCache() as cache:
+                scraper = ConFooScraper(db, log=log_msg, cache=cache)
 
                 log_msg("Starting full sync...")
                 await scraper.run_full_sync()
 
-                json_path = DATA_DIR / "confoo2026.json"
-                export_json_snapshot(db, json_path)
+            json_path = DATA_DIR / "confoo2026.json"
+            if await asyncio.to_thread(export_snapshot, json_path):
                 log_msg(f"JSON snapshot exported to {json_path}")
+            else:
+                log_msg(f"JSON snapshot unchanged at {json_path}")
 
             log_msg("")
             log_msg("[bold green]Sync complete! Restart the app to see updated data.[/bold green]")
         except Exception as e:
             log_msg(f"[bold red]Error: {e}[/bold red]")
         finally:
+            flush_timer.stop()
+            flush_log()
             button = self.query_one("#sync-button", Button)
             button.disabled = False
             button.label = "Start Full Sync"
@@ -0,0 +1,25 @@
+from confoo.db import ConfooDB
+from confoo.models import Session
+
+
+def test_track_order_survives_round_trip(tmp_path):
+    with ConfooDB(tmp_path / "confoo.db") as db:
+        db.upsert_session(Session(
+            slug="talk", title="Talk", day="Wednesday, February 25",
+            start_time="10:00", end_time="11:00", tracks=["PHP", "AI", "Cloud"],
+        ))
+        db.commit()
+
+        assert db.get_session("talk").tracks == ["PHP", "AI", "Cloud"]
+        assert db.get_all_sessions()[0].tracks == ["PHP", "AI", "Cloud"]
+
+
+def test_unrecognized_day_sorts_last(tmp_path):
+    with ConfooDB(tmp_path / "confoo.db") as db:
+        db.upsert_session(Session(slug="tbd", title="TBD", day="Someday", start_time="09:00"))
+        db.upsert_session(Session(
+            slug="talk", title="Talk", day="Wednesday, February 25", start_time="10:00",
+        ))
+        db.commit()
+
+        assert [s.slug for s in db.get_all_sessions()] == ["talk", "tbd"]